@@ -4,6 +4,7 @@ import calendar
 from pydantic import Field, PositiveInt, BaseModel, EmailStr
 import re
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from html import unescape
 import pandas as pd
 import numpy as np
@@ -12,20 +13,21 @@ from typing import Optional, List, Dict, Tuple, ClassVar
 from api.helpers.publish import (
     upload_dwca, 
     register_dataset_and_endpoint,
+    get_gbif_session,
 )
 import datetime
 import uuid
-import utm
 from dateutil.parser import parse, ParserError
-from django.template.loader import render_to_string
-from django.db.models import Q
 from api.helpers import discord_bot
 import json
-from tenacity import retry, stop_after_attempt, wait_fixed
+import ujson
+import hashlib
+import logging
 import os
 from pathlib import Path
-from requests.auth import HTTPBasicAuth
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yaml
 
 from api.dwc_specs import (
@@ -36,6 +38,8 @@ from api.dwc_specs import (
     DarwinCoreExtensionType,
 )
 
+logger = logging.getLogger(__name__)
+
 
 # Allowed Darwin Core terms
 DARWIN_CORE_TERMS = {
@@ -87,6 +91,30 @@ DARWIN_CORE_TERMS = {
     "measurementID", "parentMeasurementID", "measurementType", "measurementValue", "measurementAccuracy", "measurementUnit",
     "measurementDeterminedBy", "measurementDeterminedDate", "measurementMethod", "measurementRemarks"
 }
+_DWC_TERMS_BY_LOWER = {term.lower(): term for term in DARWIN_CORE_TERMS}
+
+ALLOWED_BASIS_OF_RECORD = frozenset({
+    'MaterialEntity', 'PreservedSpecimen', 'FossilSpecimen', 'LivingSpecimen', 'MaterialSample', 'Event',
+    'HumanObservation', 'MachineObservation', 'Taxon', 'Occurrence', 'MaterialCitation',
+})
+
+# Shared keep-alive session for GBIF API lookups, so repeated calls reuse pooled connections
+_GBIF_SESSION = requests.Session()
+_GBIF_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
+_GBIF_LOOKUP_WORKERS = 8
+
+
+def _gbif_match_cache_key(name: str) -> str:
+    # Hash the name so keys stay valid for every cache backend (no spaces or length limits)
+    return f"gbif-species-match:{hashlib.sha256(name.encode('utf-8')).hexdigest()}"
+
 
 class EMLUser(BaseModel):
     """Representation of an individual associated with the dataset."""
@@ -152,6 +180,29 @@ def _load_dwc_quick_reference() -> Dict[str, Dict[str, str]]:
     return cleaned_quick_reference
 
 
+@lru_cache(maxsize=1)
+def _dwc_quick_reference_overview() -> str:
+    quick_reference = _load_dwc_quick_reference()
+    lines = [
+        "Darwin Core quick reference sections:",
+        *(f"- {section_name} ({len(terms)} terms)" for section_name, terms in quick_reference.items()),
+        "",
+        "Call with `section` for terms in one section, or with `terms` for specific term lookups."
+    ]
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
+def _dwc_term_index() -> Dict[str, Dict[str, Tuple[str, str]]]:
+    return {
+        section_name: {
+            _normalize_lookup_key(term_name): (term_name, definition)
+            for term_name, definition in terms.items()
+        }
+        for section_name, terms in _load_dwc_quick_reference().items()
+    }
+
+
 def _find_matching_section(quick_reference: Dict[str, Dict[str, str]], section: str) -> Optional[str]:
     requested_key = _normalize_lookup_key(section)
     for section_name in quick_reference.keys():
@@ -160,6 +211,39 @@ def _find_matching_section(quick_reference: Dict[str, Dict[str, str]], section:
     return None
 
 
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _parse_event_date_token(text: str) -> datetime.datetime:
+    # Plain ISO dates are the common case after cleaning, so skip dateutil for them
+    if _ISO_DATE_RE.fullmatch(text):
+        return datetime.datetime.strptime(text, "%Y-%m-%d")
+    return parse(text)
+
+
+def _parse_event_date_string(date_value: str) -> Optional[Tuple[str, datetime.datetime]]:
+    """Return (formatted eventDate, datetime used for the future check), or None if unparseable."""
+    start_raw, separator, end_raw = date_value.partition("/")
+    is_iso_range = bool(separator) and bool(_ISO_DATE_RE.fullmatch(start_raw) and _ISO_DATE_RE.fullmatch(end_raw))
+
+    if not is_iso_range:
+        # First, try parsing the value directly – this covers most single-date strings
+        try:
+            parsed_date = _parse_event_date_token(date_value)
+            return parsed_date.isoformat(), parsed_date
+        except (ParserError, ValueError, OverflowError):
+            if not separator:
+                return None
+
+    # Treat strings containing '/' as a date range; for ranges, the end date is checked for being in the future
+    try:
+        start_date_parsed = _parse_event_date_token(start_raw)
+        end_date_parsed = _parse_event_date_token(end_raw)
+    except (ParserError, ValueError, OverflowError):
+        return None
+    return f"{start_date_parsed.isoformat()}/{end_date_parsed.isoformat()}", end_date_parsed
+
+
 class GetDarwinCoreInfo(OpenAIBaseModel):
     """
     Retrieve Darwin Core term definitions from the local quick-reference guide.
@@ -204,21 +288,10 @@ class GetDarwinCoreInfo(OpenAIBaseModel):
         section_names = list(quick_reference.keys())
 
         if not self.section and not self.terms:
-            lines = [
-                "Darwin Core quick reference sections:",
-                *(f"- {section_name} ({len(quick_reference[section_name])} terms)" for section_name in section_names),
-                "",
-                "Call with `section` for terms in one section, or with `terms` for specific term lookups."
-            ]
-            return "\n".join(lines)
+            return _dwc_quick_reference_overview()
 
         if self.terms:
-            normalized_terms_by_section: Dict[str, Dict[str, tuple[str, str]]] = {}
-            for section_name, terms in quick_reference.items():
-                normalized_terms_by_section[section_name] = {
-                    _normalize_lookup_key(term_name): (term_name, definition)
-                    for term_name, definition in terms.items()
-                }
+            normalized_terms_by_section = _dwc_term_index()
 
             found_lines = []
             missing_terms = []
@@ -417,13 +490,9 @@ class BasicValidationForSomeDwCTerms(OpenAIBaseModel):
         return lowered == "id" or lowered.endswith("id")
 
     def assess_columns_against_dwc(self, columns) -> dict:
-        normalized_map: Dict[str, str] = {}
-        for col in columns:
-            name = str(col).strip()
-            if not name or self._should_ignore_column(name):
-                continue
-            lower = name.lower()
-            normalized_map.setdefault(lower, name)
+        names = [name for col in columns if (name := str(col).strip()) and not self._should_ignore_column(name)]
+        # Iterate in reverse so the first column wins when several normalize to the same key
+        normalized_map: Dict[str, str] = {name.lower(): name for name in reversed(names)}
 
         if not normalized_map:
             return {
@@ -443,19 +512,17 @@ class BasicValidationForSomeDwCTerms(OpenAIBaseModel):
                 }
 
         best_schema = None
-        best_invalid: set[str] | None = None
         best_score = None
         for schema in ALL_SCHEMAS:
-            allowed = schema.normalized_terms
-            invalid = normalized_cols - allowed
-            shared = normalized_cols & allowed
-            score = (len(invalid), -len(shared))
+            # invalid + shared always adds up to the column count, so one set operation is enough
+            shared_count = len(normalized_cols & schema.normalized_terms)
+            score = (len(normalized_cols) - shared_count, -shared_count)
             if best_score is None or score < best_score:
                 best_score = score
                 best_schema = schema
-                best_invalid = invalid
 
-        if best_schema and best_invalid is not None and len(best_invalid) < len(normalized_cols):
+        if best_schema and best_score[0] < len(normalized_cols):
+            best_invalid = normalized_cols - best_schema.normalized_terms
             invalid_cols = sorted(normalized_map[name] for name in best_invalid)
             return {
                 'status': 'partial',
@@ -475,77 +542,117 @@ class BasicValidationForSomeDwCTerms(OpenAIBaseModel):
         }
 
     def validate_and_format_event_dates(self, df):
-        from datetime import datetime
-        
         failed_indices = []
         future_date_indices = []
-        current_date = datetime.now()
+        current_date = datetime.datetime.now().date()
 
         if "eventDate" in df.columns:
-            for idx, date_value in df["eventDate"].items():
-                try:
-                    parsed_date = None
-                    formatted_date = None
-                    
-                    if isinstance(date_value, pd.Timestamp):  # Already a datetime object
-                        formatted_date = date_value.isoformat()
-                        parsed_date = date_value.to_pydatetime()
-                    elif isinstance(date_value, str):
-                        # First, try parsing the value directly – this covers most single-date strings
-                        try:
-                            parsed_date = parse(date_value)
-                            formatted_date = parsed_date.isoformat()
-                            df.at[idx, "eventDate"] = formatted_date
-                        except (ParserError, ValueError):
-                            # If direct parsing fails **and** the string contains '/', treat it as a date range
-                            if "/" in date_value:
-                                try:
-                                    start_date, end_date = date_value.split("/", 1)
-                                    start_date_parsed = parse(start_date)
-                                    end_date_parsed = parse(end_date)
-                                    formatted_date = f"{start_date_parsed.isoformat()}/{end_date_parsed.isoformat()}"
-                                    df.at[idx, "eventDate"] = formatted_date
-                                    # For date ranges, check if the end date is in the future
-                                    parsed_date = end_date_parsed
-                                except (ParserError, ValueError):
-                                    failed_indices.append(idx)
-                            else:
-                                failed_indices.append(idx)
-                    else: 
-                        failed_indices.append(idx)
-                    
-                    # Check if the date is in the future (only if parsing was successful)
-                    if parsed_date and parsed_date.date() > current_date.date():
-                        future_date_indices.append(idx)
-                
-                except (ParserError, ValueError, TypeError):
-                    # If parsing fails, add the index to the failed_indices list
+            event_dates = df["eventDate"]
+            # Many records usually share the same eventDate, so parse each distinct string once
+            parsed_by_value = {
+                value: _parse_event_date_string(value)
+                for value in event_dates.unique()
+                if isinstance(value, str)
+            }
+
+            for idx, date_value in event_dates.items():
+                if isinstance(date_value, pd.Timestamp):  # Already a datetime object
+                    parsed_date = date_value.to_pydatetime()
+                elif isinstance(date_value, str) and parsed_by_value[date_value] is not None:
+                    parsed_date = parsed_by_value[date_value][1]
+                else:
                     failed_indices.append(idx)
+                    continue
+
+                # Check if the date is in the future
+                if parsed_date.date() > current_date:
+                    future_date_indices.append(idx)
+
+            formatted_by_value = {
+                value: parsed[0] for value, parsed in parsed_by_value.items() if parsed is not None
+            }
+            if formatted_by_value:
+                df["eventDate"] = event_dates.map(
+                    lambda value: formatted_by_value.get(value, value) if isinstance(value, str) else value
+                )
 
         return df, failed_indices, future_date_indices
     
-    def validate_scientific_names(self, df):
+    @staticmethod
+    def _fetch_gbif_name_matches(names) -> Dict[str, dict]:
+        """
+        Look up each name with the GBIF species match API (which only supports single-name GET requests).
+        Returns a mapping of name to match payload; names whose lookup failed are left out.
+        """
+        import urllib.parse
+
+        def lookup(name):
+            try:
+                encoded_name = urllib.parse.quote(str(name))
+                response = _GBIF_SESSION.get(
+                    f"https://api.gbif.org/v1/species/match?scientificName={encoded_name}",
+                    timeout=10
+                )
+                if response.status_code == 200:
+                    # ujson (already a dependency) decodes these many small payloads faster than stdlib json
+                    return name, ujson.loads(response.content)
+            except Exception as e:
+                print(f"Error checking name '{name}': {e}")
+            return name, None
+
+        if not names:
+            return {}
+        # Lookups are independent and network-bound, so overlap them; GBIF rate limiting (429)
+        # is handled by the session's Retry backoff rather than fixed sleeps. Never start more
+        # threads than there are names (e.g. when most matches came from the cache)
+        with ThreadPoolExecutor(max_workers=min(_GBIF_LOOKUP_WORKERS, len(names))) as executor:
+            return {name: data for name, data in executor.map(lookup, names) if data is not None}
+
+    @classmethod
+    def _resolve_gbif_name_matches(cls, names) -> Dict[str, dict]:
+        """Return GBIF match payloads for names, served from the persistent "gbif" cache where possible."""
+        from django.core.cache import caches
+
+        if not names:
+            return {}
+        gbif_cache = caches["gbif"]
+        cache_keys = {name: _gbif_match_cache_key(name) for name in names}
+        stored = gbif_cache.get_many(list(cache_keys.values()))
+        matches = {name: stored[key] for name, key in cache_keys.items() if key in stored}
+
+        fetched = cls._fetch_gbif_name_matches([name for name in names if name not in matches])
+        if fetched:
+            gbif_cache.set_many({cache_keys[name]: data for name, data in fetched.items()})
+        matches.update(fetched)
+        return matches
+
+    def validate_scientific_names(self, df, match_cache: Optional[Dict[str, dict]] = None):
         """
         Validate scientific names against GBIF API to detect potential typos.
         
         Args:
             df: DataFrame with scientificName column
+            match_cache: Optional dict of GBIF match results keyed by whitespace-normalized name,
+                shared between tables so each name is only looked up once per validation run
             
         Returns:
             str: Validation message describing any issues found, or None if no issues
         """
-        import urllib.parse
-        import time
-        
+        no_names_message = "No valid scientific names found in the scientificName column."
+        scientific_names = df['scientificName']
+        # Skip the value_counts hash pass entirely for an all-empty column
+        if not scientific_names.notna().any():
+            return no_names_message
+
         # Get unique scientific names and their counts
-        name_counts = df['scientificName'].value_counts()
+        name_counts = scientific_names.value_counts()
         unique_names = name_counts.index.tolist()
         
         # Remove empty/null names
         unique_names = [name for name in unique_names if pd.notna(name) and str(name).strip()]
         
         if not unique_names:
-            return "No valid scientific names found in the scientificName column."
+            return no_names_message
         
         # Determine which names to check based on quantity
         if len(unique_names) <= 50:
@@ -559,48 +666,40 @@ class BasicValidationForSomeDwCTerms(OpenAIBaseModel):
         unmatched_names = []
         corrected_names = {}
         
-        print(f"Validating {len(names_to_check)} scientific names against GBIF API...")
+        if match_cache is None:
+            match_cache = {}
+        # Whitespace variants of the same name resolve to one GBIF lookup
+        lookup_keys = {name: _WHITESPACE_RE.sub(" ", str(name)).strip() for name in names_to_check}
+        keys_to_fetch = list(dict.fromkeys(key for key in lookup_keys.values() if key not in match_cache))
         
-        for i, name in enumerate(names_to_check):
-            try:
-                # Add small delay to be respectful to GBIF API
-                if i > 0 and i % 10 == 0:
-                    time.sleep(1)
-                
-                encoded_name = urllib.parse.quote(str(name))
-                response = requests.get(
-                    f"https://api.gbif.org/v1/species/match?scientificName={encoded_name}",
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    confidence = data.get('confidence', 0)
-                    match_type = data.get('matchType', '')
-                    suggested_name = data.get('canonicalName', data.get('scientificName', ''))
-                    
-                    if match_type == 'FUZZY' and confidence >= 80:
-                        # High confidence fuzzy match - likely a typo
-                        fuzzy_matches.append({
-                            'original': name,
-                            'suggested': suggested_name,
-                            'confidence': confidence
-                        })
-                        # Auto-correct high confidence matches
-                        if confidence >= 85:
-                            corrected_names[name] = suggested_name
-                    elif match_type == 'NONE' or confidence < 50:
-                        # No match or very low confidence
-                        unmatched_names.append(name)
-                        
-            except Exception as e:
-                print(f"Error checking name '{name}': {e}")
+        print(f"Validating {len(names_to_check)} scientific names against GBIF API ({len(keys_to_fetch)} lookups)...")
+        match_cache.update(self._resolve_gbif_name_matches(keys_to_fetch))
+        
+        for name in names_to_check:
+            data = match_cache.get(lookup_keys[name])
+            if data is None:
                 continue
+            confidence = data.get('confidence', 0)
+            match_type = data.get('matchType', '')
+            suggested_name = data.get('canonicalName', data.get('scientificName', ''))
+            
+            if match_type == 'FUZZY' and confidence >= 80:
+                # High confidence fuzzy match - likely a typo
+                fuzzy_matches.append({
+                    'original': name,
+                    'suggested': suggested_name,
+                    'confidence': confidence
+                })
+                # Auto-correct high confidence matches
+                if confidence >= 85:
+                    corrected_names[name] = suggested_name
+            elif match_type == 'NONE' or confidence < 50:
+                # No match or very low confidence
+                unmatched_names.append(name)
         
-        # Apply auto-corrections to the DataFrame
+        # Apply all auto-corrections to the DataFrame in a single dict-driven pass
         if corrected_names:
-            for original, corrected in corrected_names.items():
-                df.loc[df['scientificName'] == original, 'scientificName'] = corrected
+            df['scientificName'] = df['scientificName'].replace(corrected_names)
         
         # Build validation message
         issues = []
@@ -635,100 +734,111 @@ class BasicValidationForSomeDwCTerms(OpenAIBaseModel):
     
     def run(self):
         from api.models import Agent, Table
+        from django.template.loader import render_to_string
         agent = Agent.objects.get(id=self.agent_id)
         dataset = agent.dataset
         tables = dataset.table_set.all()
         table_results = {}
+        gbif_match_cache: Dict[str, dict] = {}
+        rename_cache: Dict[tuple, Tuple[dict, list]] = {}
         for table in tables:
             table_results[table.id] = {}
             df = table.df
-            if all(isinstance(col, int) for col in df.columns):            
+            # inferred_type is computed once and cached on the Index, so wide headers are not rescanned
+            if df.columns.inferred_type == 'integer':
                 table_results[table.id]['table_errors'] = f'Table {table.id} appears to only have ints as column headers - most probably the column headers are row 1 or you need to make column headers. Fix this and run the validation report again.'
             else:
                 column_assessment = self.assess_columns_against_dwc(df.columns)
                 table_results[table.id]['dwc_schema'] = column_assessment
 
-                # Cast every column header to string first so mixed-type headers (e.g. ints) do not raise
-                standardized_columns = {str(col).lower(): col for col in df.columns}
-                matched_columns = {}
-                for term in DARWIN_CORE_TERMS:
-                    if term.lower() in standardized_columns:
-                        original_col = standardized_columns[term.lower()]
-                        matched_columns[term] = original_col
-
-                # Determine columns that couldn't be matched *before* any renaming
-                unmatched_columns = [col for col in df.columns if col not in matched_columns.values()]
+                # Tables in a dataset often share a header row, so the matching is done once per distinct header
+                header_signature = tuple(df.columns)
+                if header_signature not in rename_cache:
+                    # Cast every column header to string first so mixed-type headers (e.g. ints) do not raise
+                    standardized_columns = {str(col).lower(): col for col in df.columns}
+                    matched_columns = {
+                        _DWC_TERMS_BY_LOWER[lowered]: standardized_columns[lowered]
+                        for lowered in standardized_columns.keys() & _DWC_TERMS_BY_LOWER.keys()
+                    }
+
+                    # Determine columns that couldn't be matched *before* any renaming
+                    matched_originals = set(matched_columns.values())
+                    rename_cache[header_signature] = (
+                        {orig: term for term, orig in matched_columns.items() if term != orig},
+                        [col for col in df.columns if col not in matched_originals],
+                    )
+                rename_mapping, unmatched_columns = rename_cache[header_signature]
 
                 # Apply renaming now (mapping original ➜ standard term) so downstream logic sees the correct headers
-                if matched_columns:
-                    rename_mapping = {orig: term for term, orig in matched_columns.items() if term != orig}
-                    if rename_mapping:
-                        df.rename(columns=rename_mapping, inplace=True)
+                if rename_mapping:
+                    df.rename(columns=rename_mapping, inplace=True)
 
-                table_results[table.id]['unmatched_columns'] = unmatched_columns
+                table_results[table.id]['unmatched_columns'] = list(unmatched_columns)
+                # The checks below only convert existing columns, so the header set is fixed from here on
+                columns = frozenset(df.columns)
                 
                 validation_errors = {}
-                allowed_basis_of_record = {'MaterialEntity', 'PreservedSpecimen', 'FossilSpecimen', 'LivingSpecimen', 'MaterialSample', 'Event', 'HumanObservation', 'MachineObservation', 'Taxon', 'Occurrence', 'MaterialCitation'}
-                if 'basisOfRecord' in df.columns:
-                    invalid_basis = df[~df['basisOfRecord'].isin(allowed_basis_of_record)]
-                    if not invalid_basis.empty:
-                        validation_errors['basisOfRecord'] = invalid_basis.index.tolist()
-                if 'decimalLatitude' in df.columns:
+                # Checks use boolean NumPy masks over the index rather than slicing out sub-DataFrames
+                if 'basisOfRecord' in columns:
+                    invalid_basis_mask = ~df['basisOfRecord'].isin(ALLOWED_BASIS_OF_RECORD).to_numpy()
+                    if invalid_basis_mask.any():
+                        validation_errors['basisOfRecord'] = df.index[invalid_basis_mask].tolist()
+                if 'decimalLatitude' in columns:
                     lat_numeric = pd.to_numeric(df['decimalLatitude'], errors='coerce')
                     # Update the DataFrame so the column is stored as numeric (NaNs where conversion failed)
                     df['decimalLatitude'] = lat_numeric
-                    invalid_latitude = df[lat_numeric.isna() | (lat_numeric < -90) | (lat_numeric > 90)]
-                    if not invalid_latitude.empty:
-                        validation_errors['decimalLatitude'] = invalid_latitude.index.tolist()
-                if 'decimalLongitude' in df.columns:
+                    lat_values = lat_numeric.to_numpy(dtype=float, na_value=np.nan)
+                    invalid_latitude_mask = np.isnan(lat_values) | (lat_values < -90) | (lat_values > 90)
+                    if invalid_latitude_mask.any():
+                        validation_errors['decimalLatitude'] = df.index[invalid_latitude_mask].tolist()
+                if 'decimalLongitude' in columns:
                     lon_numeric = pd.to_numeric(df['decimalLongitude'], errors='coerce')
                     # Persist numeric conversion back to the DataFrame
                     df['decimalLongitude'] = lon_numeric
-                    invalid_longitude = df[lon_numeric.isna() | (lon_numeric < -180) | (lon_numeric > 180)]
-                    if not invalid_longitude.empty:
-                        validation_errors['decimalLongitude'] = invalid_longitude.index.tolist()
-                if 'individualCount' in df.columns:
+                    lon_values = lon_numeric.to_numpy(dtype=float, na_value=np.nan)
+                    invalid_longitude_mask = np.isnan(lon_values) | (lon_values < -180) | (lon_values > 180)
+                    if invalid_longitude_mask.any():
+                        validation_errors['decimalLongitude'] = df.index[invalid_longitude_mask].tolist()
+                if 'individualCount' in columns:
                     ind_numeric = pd.to_numeric(df['individualCount'], errors='coerce')
                     # Persist numeric conversion back to the DataFrame
                     df['individualCount'] = ind_numeric
-                    invalid_individual_count = df[ind_numeric.isna() | (ind_numeric <= 0) | (ind_numeric % 1 != 0)]
-                    if not invalid_individual_count.empty:
-                        validation_errors['individualCount'] = invalid_individual_count.index.tolist()
-                if 'catalogNumber' in df.columns:
+                    ind_values = ind_numeric.to_numpy(dtype=float, na_value=np.nan)
+                    invalid_individual_count_mask = np.isnan(ind_values) | (ind_values <= 0) | (np.mod(ind_values, 1) != 0)
+                    if invalid_individual_count_mask.any():
+                        validation_errors['individualCount'] = df.index[invalid_individual_count_mask].tolist()
+                if 'catalogNumber' in columns:
                     # Check for duplicate catalogNumbers
-                    duplicate_catalog_numbers = df[df['catalogNumber'].duplicated(keep=False)]
-                    if not duplicate_catalog_numbers.empty:
-                        validation_errors['catalogNumber'] = duplicate_catalog_numbers.index.tolist()
+                    duplicate_catalog_mask = df['catalogNumber'].duplicated(keep=False).to_numpy()
+                    if duplicate_catalog_mask.any():
+                        validation_errors['catalogNumber'] = df.index[duplicate_catalog_mask].tolist()
                 
                 corrected_dates_df, event_date_error_indices, future_date_indices = self.validate_and_format_event_dates(df)
                 validation_errors['eventDate'] = event_date_error_indices
                 validation_errors['eventDateFuture'] = future_date_indices
                 table_results[table.id]['validation_errors'] = validation_errors
-
-                table.df = corrected_dates_df
-                table.save()
                 
                 general_errors = {}
 
-                if 'scientificName' not in df.columns:
+                if 'scientificName' not in columns:
                     general_errors['scientificName'] = 'scientificName is missing from this Table (this is fine if this Table is a Measurement or Fact extension)'
                 else:
                     # Scientific name validation using GBIF API
-                    scientific_name_issues = self.validate_scientific_names(df)
+                    scientific_name_issues = self.validate_scientific_names(df, gbif_match_cache)
                     if scientific_name_issues:
                         general_errors['scientificName'] = scientific_name_issues
 
-                if ('organismQuantity' in df.columns and 'organismQuantityType' not in df.columns):
+                if ('organismQuantity' in columns and 'organismQuantityType' not in columns):
                     general_errors['organismQuantity'] = 'organismQuantity is a column in this Table, but the corresponding required column "organismQuantityType" is missing.'
-                elif ('organismQuantityType' in df.columns and 'organismQuantity' not in df.columns):
+                elif ('organismQuantityType' in columns and 'organismQuantity' not in columns):
                     general_errors['organismQuantity'] = 'organismQuantityType is a column in this Table, but the corresponding required column "organismQuantity" is missing.'
-                if 'basisOfRecord' not in df.columns:
+                if 'basisOfRecord' not in columns:
                     general_errors['basisOfRecord'] = 'basisOfRecord is missing from this Table (this is fine if the core is Taxon or if this Table is a Measurement or Fact extension)'
-                if 'occurrenceID' not in df.columns:
+                if 'occurrenceID' not in columns:
                     general_errors['occurrenceID'] = 'occurrenceID is missing from this Table and is a required field. If this is a Measurement or Fact table, the occurrenceID column needs to link back to the core occurrence table.'
-                if 'id' not in df.columns and 'ID' not in df.columns and 'measurementID' not in df.columns:
+                if 'id' not in columns and 'ID' not in columns and 'measurementID' not in columns:
                     # It is an occurrence core table
-                    if 'occurrenceID' in df.columns:
+                    if 'occurrenceID' in columns:
                         occurrence_ids = df['occurrenceID'].astype('string').fillna('').str.strip()
                         non_empty_occurrence_ids = occurrence_ids[occurrence_ids != '']
                         if not non_empty_occurrence_ids.str.casefold().is_unique:
@@ -741,10 +851,82 @@ class BasicValidationForSomeDwCTerms(OpenAIBaseModel):
                             )
 
                 table_results[table.id]['general_errors'] = general_errors
+
+                # All conversions above mutate the same frame, so it is pickled and saved once per table
+                table.df = corrected_dates_df
+                table.save()
         
+        report = render_to_string('validation.txt', context={ 'tables': table_results })
         print('validation report:')
-        print(render_to_string('validation.txt', context={ 'tables': table_results }))
-        return render_to_string('validation.txt', context={ 'tables': table_results })
+        print(report)
+        return report
+
+
+# Strip markdown code fences (and an optional "python" language tag) wrapped around agent-written code
+_CODE_FENCE_LEAD_RE = re.compile(r"^(\s|`)*(?i:python)?\s*")
+_CODE_FENCE_TRAIL_RE = re.compile(r"(\s|`)*$")
+
+
+@lru_cache(maxsize=128)
+def _compile_user_code(code: str):
+    # Identical snippets (e.g. retried or replayed code) skip the parse/compile pass
+    return compile(code, "<string>", "exec")
+
+
+@lru_cache(maxsize=1)
+def _python_context_template() -> Dict[str, object]:
+    """Globals available to agent code in `Python.run`, built once on first use (models must be loaded by then)."""
+    from api.models import Dataset, Table
+    import utm
+
+    # Helper utilities for safe table replacement/deletion
+    def replace_table(old_table_id, new_df, new_title=None, description=None):
+        table = Table.objects.get(id=old_table_id)
+        table.df = new_df
+        if new_title is not None:
+            table.title = new_title
+        if description is not None:
+            table.description = description
+        table.save()
+        print(f"Replaced table {old_table_id} in-place")
+        return table.id
+
+    def create_or_replace(dataset_id, title, new_df, description=None):
+        existing = Table.objects.filter(dataset_id=dataset_id, title=title).order_by('-updated_at', '-id').first()
+        if existing is None:
+            t = Table(dataset_id=dataset_id, title=title, df=new_df, description=description or '')
+            t.save()
+            print(f"Created table {t.id} with title '{title}'")
+            return t.id
+        existing.df = new_df
+        if description is not None:
+            existing.description = description
+        existing.save()
+        print(f"Updated existing table {existing.id} with title '{title}'")
+        return existing.id
+
+    def delete_tables(dataset_id, exclude_ids=None):
+        exclude_ids = exclude_ids or []
+        qs = Table.objects.filter(dataset_id=dataset_id).exclude(id__in=exclude_ids)
+        deleted_ids = list(qs.values_list('id', flat=True))
+        qs.delete()
+        if deleted_ids:
+            print(f"Deleted tables {deleted_ids}")
+        return deleted_ids
+
+    return {
+        'Dataset': Dataset,
+        'Table': Table,
+        'pd': pd,
+        'np': np,
+        'uuid': uuid,
+        'datetime': datetime,
+        're': re,
+        'utm': utm,
+        'replace_table': replace_table,
+        'create_or_replace': create_or_replace,
+        'delete_tables': delete_tables,
+    }
 
 
 class Python(OpenAIBaseModel):
@@ -781,67 +963,15 @@ class Python(OpenAIBaseModel):
     code: str = Field(..., description="String containing valid python code to be executed in `exec()`")
 
     def run(self):
-        code = re.sub(r"^(\s|`)*(?i:python)?\s*", "", self.code)
-        code = re.sub(r"(\s|`)*$", "", code)
+        code = _CODE_FENCE_TRAIL_RE.sub("", _CODE_FENCE_LEAD_RE.sub("", self.code))
         old_stdout = sys.stdout
         new_stdout = StringIO()
         sys.stdout = new_stdout
         result = ''
         try:
-            from api.models import Dataset, Table
-
-            # Helper utilities for safe table replacement/deletion
-            def replace_table(old_table_id, new_df, new_title=None, description=None):
-                table = Table.objects.get(id=old_table_id)
-                table.df = new_df
-                if new_title is not None:
-                    table.title = new_title
-                if description is not None:
-                    table.description = description
-                table.save()
-                print(f"Replaced table {old_table_id} in-place")
-                return table.id
-
-            def create_or_replace(dataset_id, title, new_df, description=None):
-                existing = Table.objects.filter(dataset_id=dataset_id, title=title).order_by('-updated_at', '-id').first()
-                if existing is None:
-                    t = Table(dataset_id=dataset_id, title=title, df=new_df, description=description or '')
-                    t.save()
-                    print(f"Created table {t.id} with title '{title}'")
-                    return t.id
-                existing.df = new_df
-                if description is not None:
-                    existing.description = description
-                existing.save()
-                print(f"Updated existing table {existing.id} with title '{title}'")
-                return existing.id
-
-            def delete_tables(dataset_id, exclude_ids=None):
-                exclude_ids = exclude_ids or []
-                qs = Table.objects.filter(dataset_id=dataset_id).exclude(id__in=exclude_ids)
-                deleted_ids = list(qs.values_list('id', flat=True))
-                qs.delete()
-                if deleted_ids:
-                    print(f"Deleted tables {deleted_ids}")
-                return deleted_ids
-
-            context_locals = {}
-            context_globals = {
-                'Dataset': Dataset,
-                'Table': Table,
-                'pd': pd,
-                'np': np,
-                'uuid': uuid,
-                'datetime': datetime,
-                're': re,
-                'utm': utm,
-                'replace_table': replace_table,
-                'create_or_replace': create_or_replace,
-                'delete_tables': delete_tables,
-            }
-            combined_context = context_globals.copy()
-            combined_context.update(context_locals)
-            exec(code, combined_context, combined_context)  # See https://github.com/python/cpython/issues/86084
+            # exec() writes into the globals it is given, so each run gets its own copy of the template
+            combined_context = _python_context_template().copy()
+            exec(_compile_user_code(code), combined_context, combined_context)  # See https://github.com/python/cpython/issues/86084
             stdout_value = new_stdout.getvalue()
             
             if stdout_value:
@@ -985,19 +1115,34 @@ class RollBack(OpenAIBaseModel):
             agent__in=agents,
             openai_obj__tool_calls__contains=[{'function': {'name': 'Python'}}]
         )
-        for msg in function_messages:
-            if msg:
-                for tool_call in msg.openai_obj['tool_calls']:
-                    if tool_call['function']['name'] == 'Python':
-                        result = Message.objects.filter(agent__in=agents, openai_obj__tool_call_id=tool_call['id']).first()
-                        snippet = {
-                            'code_run': tool_call['function']['arguments'],
-                            'results': result.openai_obj['content']
-                        }
-                        code_snippets.append(snippet)
+        python_tool_calls = [
+            tool_call
+            for msg in function_messages
+            for tool_call in msg.openai_obj['tool_calls']
+            if tool_call['function']['name'] == 'Python'
+        ]
+
+        # Fetch every tool result in one query rather than one per tool call; the earliest message wins, as .first() did
+        results_by_tool_call_id = {}
+        for result_message in Message.objects.filter(
+            agent__in=agents,
+            openai_obj__tool_call_id__in=[tool_call['id'] for tool_call in python_tool_calls],
+        ):
+            results_by_tool_call_id.setdefault(result_message.openai_obj['tool_call_id'], result_message)
+
+        for tool_call in python_tool_calls:
+            result = results_by_tool_call_id.get(tool_call['id'])
+            snippet = {
+                'code_run': tool_call['function']['arguments'],
+                'results': result.openai_obj['content']
+            }
+            code_snippets.append(snippet)
         
         discord_bot.send_discord_message(f"Dataset tables rolled back for Dataset id {agent.dataset.id}.")
-        return json.dumps({'new_table_ids': [t.id for t in tables], 'code_snippets': code_snippets})
+        return ujson.dumps(
+            {'new_table_ids': [t.id for t in tables], 'code_snippets': code_snippets},
+            escape_forward_slashes=False,
+        )
 
 class SetEML(OpenAIBaseModel):
     """Sets the EML (Metdata) for a Dataset via an Agent, returns a success or error message. Note that SetBasicMetadata should be used to set the dataset Title and Description."""
@@ -1501,7 +1646,7 @@ class SetEML(OpenAIBaseModel):
     def run(self):
         try:
             from api.models import Agent
-            agent = Agent.objects.get(id=self.agent_id)
+            agent = Agent.objects.select_related('dataset').get(id=self.agent_id)
             dataset = agent.dataset
             eml = dataset.eml or {}
 
@@ -1715,7 +1860,7 @@ class SetBasicMetadata(OpenAIBaseModel):
     def run(self):
         try:
             from api.models import Agent
-            agent = Agent.objects.get(id=self.agent_id)
+            agent = Agent.objects.select_related('dataset').get(id=self.agent_id)
             dataset = agent.dataset
             
             # Check if title and description are required
@@ -1746,7 +1891,7 @@ class SetAgentTaskToComplete(OpenAIBaseModel):
     def run(self):
         from api.models import Agent
         try:
-            agent = Agent.objects.get(id=self.agent_id)
+            agent = Agent.objects.select_related('dataset').get(id=self.agent_id)
             # Guardrail: Data content exploration must set basic metadata first.
             if (
                 agent.task
@@ -1800,7 +1945,7 @@ class UploadDwCA(OpenAIBaseModel):
         from api.models import Agent, Dataset
 
         try:
-            agent = Agent.objects.get(id=self.agent_id)
+            agent = Agent.objects.select_related('dataset').get(id=self.agent_id)
             dataset = agent.dataset
             tables = {table.id: table for table in dataset.table_set.all()}
 
@@ -1905,6 +2050,24 @@ class UploadDwCA(OpenAIBaseModel):
             return repr(e)[:2000]
 
 
+_AGENT_KICKOFF_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="agent-kickoff")
+
+
+def _kick_off_agent(agent_id: int):
+    """Run an agent's first turn off the request thread. Agent.next_message claims busy_thinking with a
+    conditional update, so if the dataset refresh endpoint gets there first this is a no-op, and if this
+    worker dies before claiming the turn the next refresh picks it up."""
+    from django.db import connection
+    from api.models import Agent
+    try:
+        Agent.objects.get(id=agent_id).next_message()
+    except Exception:
+        logger.exception("Failed to start agent %s", agent_id)
+    finally:
+        # Worker threads get their own DB connection; release it rather than leaking one per kick-off
+        connection.close()
+
+
 class PublishToGBIF(OpenAIBaseModel):
     """
     Registers an existing DwCA (previously uploaded with UploadDwCA) with the GBIF API.
@@ -1926,19 +2089,20 @@ class PublishToGBIF(OpenAIBaseModel):
             gbif_url = register_dataset_and_endpoint(dataset.title, dataset.description, dataset.dwca_url)
             dataset.gbif_url = gbif_url
             dataset.published_at = datetime.datetime.now()
-            dataset.save()
+            dataset.save(update_fields=['gbif_url', 'published_at'])
 
             # If this is NOT the final task, automatically mark complete and advance.
             # For the final task (e.g., Data maintenance), keep the conversation open.
-            last_task = Task.objects.last()
-            if agent.task_id != (last_task.id if last_task else None):
+            last_task_id = Task.objects.values_list('id', flat=True).last()
+            if agent.task_id != last_task_id:
                 agent.completed_at = datetime.datetime.now()
-                agent.save()
+                agent.save(update_fields=['completed_at'])
 
-                # Create the next agent in the workflow and kick it off, if any
+                # Create the next agent in the workflow and kick it off in the background, if any, so this
+                # tool call returns without waiting on the new agent's first model round trip
                 new_agent = dataset.next_agent()
                 if new_agent:
-                    new_agent.next_message()
+                    _AGENT_KICKOFF_EXECUTOR.submit(_kick_off_agent, new_agent.id)
 
             return f'Successfully registered dataset with GBIF. URL: {gbif_url}'
         except Exception as e:
@@ -1950,33 +2114,30 @@ class ValidateDwCA(OpenAIBaseModel):
     Submits the dataset's DwCA URL to the GBIF validator, then polls the validator until the job finishes.
 
     This can take a long time (often >10 min). The calling agent should keep the user informed while polling.
-    The polling interval can be customised via `poll_interval_seconds`; default is 60 seconds (1 min).
+    Polling starts every few seconds and backs off exponentially; `poll_interval_seconds` caps the wait between
+    polls (default 60 seconds / 1 min).
     """
     agent_id: PositiveInt = Field(...)
-    poll_interval_seconds: PositiveInt = Field(60, description="Seconds to wait between polling attempts.")
+    poll_interval_seconds: PositiveInt = Field(60, description="Maximum seconds to wait between polling attempts.")
 
     def run(self):
         from api.models import Agent
-        import requests, time
-        from requests.auth import HTTPBasicAuth
-        from tenacity import retry, stop_after_attempt, wait_fixed
+        from tenacity import retry, retry_if_exception_type, stop_after_delay, wait_exponential
 
         try:
             agent = Agent.objects.get(id=self.agent_id)
             dataset = agent.dataset
             if not dataset.dwca_url:
                 return 'Error: No DwCA URL found. Run UploadDwCA first.'
-            auth = HTTPBasicAuth(os.getenv('GBIF_USER'), os.getenv('GBIF_PASSWORD'))
+            # One authenticated keep-alive session for the submission and every status poll
+            session = get_gbif_session()
 
             # Align with GBIF Validator API: send the DwCA URL as a multipart/form-data field named "fileUrl" and
             # request a JSON response (same behaviour as: curl -u user:pass -H "Accept: application/json" \
-            #   -F "fileUrl=<dwca_url>" https://api.gbif.org/v1/validation/url )
-            headers = {'Accept': 'application/json'}
+            #   -F "fileUrl=<dwca_url>" https://api.gbif.org/v1/validation/url ). The session sends the auth and Accept header.
             files = {'fileUrl': (None, dataset.dwca_url)}  # (None, ...) ensures we send as a simple form field, not a file
-            submit_resp = requests.post(
+            submit_resp = session.post(
                 'https://api.gbif.org/v1/validation/url',
-                auth=auth,
-                headers=headers,
                 files=files,
                 timeout=30,
             )
@@ -1986,23 +2147,31 @@ class ValidateDwCA(OpenAIBaseModel):
                 discord_bot.send_discord_message(f"🚨 GBIF Validator Error: {error_msg}\nDataset: {dataset.name if hasattr(dataset, 'name') else 'Unknown'}\nAgent ID: {self.agent_id}")
                 return error_msg
 
-            key = submit_resp.json().get('key')
+            key = ujson.loads(submit_resp.content).get('key')
             if not key:
                 error_msg = f'Validator response did not contain a key: {submit_resp.text}'
                 # Notify developers of missing validation key
                 discord_bot.send_discord_message(f"⚠️ GBIF Validator Key Error: {error_msg}\nDataset: {dataset.name if hasattr(dataset, 'name') else 'Unknown'}\nAgent ID: {self.agent_id}")
                 return error_msg
 
-            @retry(stop=stop_after_attempt(1000), wait=wait_fixed(self.poll_interval_seconds))
+            # Quick jobs are picked up within seconds, long ones are polled at most every poll_interval_seconds;
+            # the overall deadline keeps the old budget of 1000 polls at poll_interval_seconds
+            @retry(
+                stop=stop_after_delay(1000 * self.poll_interval_seconds),
+                wait=wait_exponential(multiplier=1, exp_base=1.3, min=2, max=self.poll_interval_seconds),
+                retry=retry_if_exception_type((requests.RequestException, RuntimeError)),
+            )
             def fetch_status():
-                resp = requests.get(f'https://api.gbif.org/v1/validation/{key}', auth=auth, timeout=30)
+                resp = session.get(f'https://api.gbif.org/v1/validation/{key}', timeout=30)
                 if resp.status_code != 200:
                     # Retry on HTTP error
                     raise requests.HTTPError(f'Status fetch failed with {resp.status_code}')
-                data = resp.json()
+                # Decode the whole body so only the top-level "status" counts, never a nested per-file/issue one
+                payload = ujson.loads(resp.content)
+                status = payload.get('status') if isinstance(payload, dict) else None
                 # If still running, raise to retry
-                if data.get('status') not in ('SUCCEEDED', 'FAILED', 'FINISHED'):
-                    raise Exception('Validation still running')
+                if status not in ('SUCCEEDED', 'FAILED', 'FINISHED'):
+                    raise RuntimeError('Validation still running')
                 return resp.text
 
             try:
@@ -2038,7 +2207,7 @@ class SendDiscordMessage(OpenAIBaseModel):
                 formatted_message = f"🚨 **URGENT** 🚨\n{self.message}"
             
             # Use the existing Discord bot functionality
-            discord_bot.send_discord_message(formatted_message)
+            discord_bot.send_discord_message(formatted_message, wait=True)
             return "Message sent successfully to developers via Discord"
         
         except Exception as e:
@@ -2087,9 +2256,9 @@ class LogBugWithDeveloper(OpenAIBaseModel):
 
             formatted_message = "\n".join(lines)
             if allowed_mentions is None:
-                discord_bot.send_discord_message(formatted_message)
+                discord_bot.send_discord_message(formatted_message, wait=True)
             else:
-                discord_bot.send_discord_message(formatted_message, allowed_mentions=allowed_mentions)
+                discord_bot.send_discord_message(formatted_message, allowed_mentions=allowed_mentions, wait=True)
             return "Bug report sent to developers via Discord (tagged @_rkian)."
         except Exception as e:
             return f"Failed to log bug with developer: {repr(e)}"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Iterable, Tuple
 
@@ -37,9 +38,9 @@ class DarwinCoreSchema:
     def remote_spec_uri(self) -> str | None:
         return self.spec_uri
 
-    @property
-    def normalized_terms(self) -> set[str]:
-        return {term.lower() for term in self.terms}
+    @cached_property
+    def normalized_terms(self) -> frozenset[str]:
+        return frozenset(term.lower() for term in self.terms)
 
 
 class DarwinCoreCoreType(str, Enum):
@@ -1,8 +1,14 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 
 import requests
 
+# Error-path notifications post off the calling thread so they return without waiting on Discord.
+# Pending posts are still flushed at interpreter exit (executor threads are joined).
+_session = requests.Session()
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="discord-webhook")
+
 
 def get_developer_user_id() -> str:
     # New generic key, with backward compatibility for earlier rollout naming.
@@ -21,15 +27,33 @@ def get_developer_mention() -> str:
     return fallback_handle or "@_rkian"
 
 
-def send_discord_message(message: str, allowed_mentions: Optional[Dict[str, Any]] = None):
+def send_discord_message(message: str, allowed_mentions: Optional[Dict[str, Any]] = None, wait: bool = False):
+    """Post a message to the developer webhook. By default the post is queued and failures are only printed;
+    pass wait=True to send it on the calling thread and raise if Discord did not accept it."""
     print(message)
     payload: Dict[str, Any] = {"content": message}
     if allowed_mentions is not None:
         payload["allowed_mentions"] = allowed_mentions
 
-    response = requests.post(os.getenv('DISCORD_WEBHOOK'), json=payload)
-
-    if response.status_code == 204:
-        print("Message sent successfully.")
+    if wait:
+        _post_webhook(payload)
     else:
-        print(f"Failed to send message. Status code: {response.status_code}")
+        _executor.submit(_post_webhook_in_background, payload)
+
+
+def _post_webhook(payload: Dict[str, Any]):
+    webhook_url = os.getenv('DISCORD_WEBHOOK')
+    if not webhook_url:
+        raise RuntimeError("DISCORD_WEBHOOK is not set")
+
+    response = _session.post(webhook_url, json=payload, timeout=10)
+    if response.status_code != 204:
+        raise RuntimeError(f"Discord webhook returned status code {response.status_code}")
+    print("Message sent successfully.")
+
+
+def _post_webhook_in_background(payload: Dict[str, Any]):
+    try:
+        _post_webhook(payload)
+    except Exception as e:
+        print(f"Failed to send message: {e!r}")
@@ -2,6 +2,7 @@ import json
 import hashlib
 import tempfile
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from django.conf import settings
@@ -227,6 +228,12 @@ def _messages_to_responses_input(messages) -> List[Dict[str, Any]]:
 
 
 def _functions_to_responses_tools(functions) -> List[Dict[str, Any]]:
+    # A task's tool set is fixed, so the payload is built once per distinct set and reused on every turn
+    return list(_responses_tools_for(tuple(functions)))
+
+
+@lru_cache(maxsize=64)
+def _responses_tools_for(functions: tuple) -> tuple:
     tools = []
     for function_model in functions:
         schema = function_model.openai_schema()
@@ -236,7 +243,7 @@ def _functions_to_responses_tools(functions) -> List[Dict[str, Any]]:
             'description': schema.get('description') or '',
             'parameters': schema['parameters'],
         })
-    return tools
+    return tuple(tools)
 
 
 def _response_to_compat_message(response) -> CompatAssistantMessage:
@@ -333,10 +340,17 @@ def custom_schema(cls: BaseModel) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=None)
+def _cached_custom_schema(cls) -> Dict[str, Any]:
+    return custom_schema(cls)
+
+
 class OpenAIBaseModel(BaseModel):
     @classmethod
     def openai_schema(cls):
-        return custom_schema(cls)
+        # A tool's schema only depends on its class, so it is generated once per process and shared;
+        # callers must treat the returned dict as read-only
+        return _cached_custom_schema(cls)
 
 # def get_function(fn):
 #     if fn.name.lower() == 'python' and fn.arguments.replace(' ', '')[:8] != '{"code":':
@@ -346,24 +360,25 @@ class OpenAIBaseModel(BaseModel):
 #         fn.arguments = json.loads(fn.arguments, strict=False) 
 #     return fn
 
+_SCHEMA_METADATA_NOISE_KEYS = frozenset({"title", "description", "additionalProperties"})
+_SCHEMA_MAP_CONTAINER_KEYS = frozenset({"properties", "$defs", "definitions", "patternProperties"})
+
+
 def _remove_schema_metadata_noise(node, preserve_map_keys: bool = False) -> None:
     """Remove verbose schema metadata without deleting actual property names."""
-    if isinstance(node, dict):
-        for key in list(node.keys()):
-            value = node[key]
-
+    # Single iterative pass over the whole schema (no recursion), stripping every noise key at once
+    stack = [(node, preserve_map_keys)]
+    while stack:
+        current, preserve_keys = stack.pop()
+        if isinstance(current, dict):
             # In mapping containers, keys are user-defined identifiers (e.g. field names).
             # Preserve those keys even if they match metadata names like "title".
-            if preserve_map_keys:
-                _remove_schema_metadata_noise(value, preserve_map_keys=False)
-                continue
-
-            if key in {"title", "description", "additionalProperties"}:
-                del node[key]
+            if preserve_keys:
+                stack.extend((value, False) for value in current.values())
                 continue
 
-            child_preserve_map_keys = key in {"properties", "$defs", "definitions", "patternProperties"}
-            _remove_schema_metadata_noise(value, preserve_map_keys=child_preserve_map_keys)
-    elif isinstance(node, list):
-        for item in node:
-            _remove_schema_metadata_noise(item, preserve_map_keys=False)
+            for key in [key for key in current if key in _SCHEMA_METADATA_NOISE_KEYS]:
+                del current[key]
+            stack.extend((value, key in _SCHEMA_MAP_CONTAINER_KEYS) for key, value in current.items())
+        elif isinstance(current, list):
+            stack.extend((item, False) for item in current)
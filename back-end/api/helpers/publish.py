@@ -5,15 +5,20 @@ from datetime import date, datetime, timezone
 import os
 from pathlib import Path
 import traceback
+from dataclasses import dataclass
+from functools import lru_cache
 from minio import Minio
-from tenacity import retry, stop_after_attempt, wait_fixed
+from minio.error import S3Error, ServerError
+from tenacity import retry, retry_if_exception, stop_after_delay, wait_exponential_jitter
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-import uuid
-import xmltodict
 import re
 import json
+import ujson
 import zipfile
+import numpy as np
 import pandas as pd
 from dwcawriter import Archive
 from dwcawriter.table import Table as DwcaWriterTable
@@ -31,6 +36,87 @@ _BASE_DIR = Path(__file__).resolve().parent.parent
 _TEMPLATES_ROOT = _BASE_DIR / "templates"
 
 
+# Seconds to wait on the GBIF registry before giving up, so a stalled connection cannot hang publication
+_GBIF_REGISTRY_TIMEOUT = 30
+
+
+@dataclass(frozen=True)
+class PublishSettings:
+    """Environment configuration for MinIO uploads and GBIF registration."""
+    minio_uri: str | None
+    minio_access_key: str | None
+    minio_secret_key: str | None
+    minio_bucket: str | None
+    minio_bucket_folder: str | None
+    dwca_export_dir: str | None
+    gbif_api_url: str | None
+    gbif_user: str | None
+    gbif_password: str | None
+    gbif_publishing_organization_key: str | None
+    gbif_installation_key: str | None
+
+
+@lru_cache(maxsize=1)
+def get_publish_settings() -> PublishSettings:
+    """Read the publishing environment once, on first use (not at import, so the env can be set up first)."""
+    return PublishSettings(
+        minio_uri=os.getenv('MINIO_URI'),
+        minio_access_key=os.getenv('MINIO_ACCESS_KEY'),
+        minio_secret_key=os.getenv('MINIO_SECRET_KEY'),
+        minio_bucket=os.getenv('MINIO_BUCKET'),
+        minio_bucket_folder=os.getenv('MINIO_BUCKET_FOLDER'),
+        # Point DWCA_EXPORT_DIR at a tmpfs mount (e.g. /dev/shm) to keep the export/upload round trip in memory
+        dwca_export_dir=os.getenv('DWCA_EXPORT_DIR') or None,
+        gbif_api_url=os.getenv('GBIF_API_URL'),
+        gbif_user=os.getenv('GBIF_USER'),
+        gbif_password=os.getenv('GBIF_PASSWORD'),
+        gbif_publishing_organization_key=os.getenv('GBIF_PUBLISHING_ORGANIZATION_KEY'),
+        gbif_installation_key=os.getenv('GBIF_INSTALLATION_KEY'),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_gbif_session() -> requests.Session:
+    """
+    Shared, authenticated session for the GBIF registry and validator APIs.
+    Keeps the TLS connection alive across dataset/endpoint registration and validator polling.
+    Content-Type is left to each request (JSON bodies vs. multipart form uploads).
+    """
+    session = requests.Session()
+    settings = get_publish_settings()
+    session.auth = HTTPBasicAuth(settings.gbif_user, settings.gbif_password)
+    session.headers.update({'Accept': 'application/json'})
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+
+@lru_cache(maxsize=64)
+def _load_spec(spec_path: str) -> tuple[str, dict[str, str]]:
+    """Row type and term name -> qualName map for a vendored spec file, parsed once per process."""
+    # ElementTree's C parser hands back attributes directly, without building an intermediate dict per property
+    extension = ET.parse(spec_path).getroot()
+    # GBIF specs declare a default namespace, so tags arrive as "{http://rs.gbif.org/extension/}extension"
+    namespace, _, root_tag = extension.tag.rpartition("}")
+    if root_tag != "extension":
+        raise ValueError(f"Specification {spec_path} does not contain an 'extension' root element.")
+
+    row_type = extension.get("rowType")
+    if not row_type:
+        raise ValueError(f"Specification {spec_path} is missing a '@rowType' attribute.")
+
+    property_tag = f"{namespace}}}property" if namespace else "property"
+    field_map = {}
+    for prop in extension.iterfind(property_tag):
+        name = prop.get("name")
+        qual_name = prop.get("qualName")
+        if not name or not qual_name:
+            # Skip malformed entries but keep processing others.
+            continue
+        field_map[name] = qual_name
+
+    return row_type, field_map
+
+
 class LocalSpecTable(DwcaWriterTable):
     """Table implementation that supports both vendored local spec files and GBIF URLs."""
 
@@ -49,36 +135,25 @@ class LocalSpecTable(DwcaWriterTable):
         if not spec_path.exists():
             raise FileNotFoundError(f"Specification file not found at {spec_path}")
 
-        with spec_path.open("r", encoding="utf-8") as spec_file:
-            spec_json = xmltodict.parse(spec_file.read())
-
-        extension = spec_json.get("extension")
-        if not extension:
-            raise ValueError(f"Specification {spec_path} does not contain an 'extension' root element.")
-
-        row_type = extension.get("@rowType")
-        if not row_type:
-            raise ValueError(f"Specification {spec_path} is missing a '@rowType' attribute.")
+        row_type, field_map = _load_spec(str(spec_path))
         self.row_type = row_type
+        # Copy so a table never mutates the cached mapping shared with later publishes
+        self.dwc_fields = dict(field_map)
 
-        properties = extension.get("property")
-        if properties is None:
-            self.dwc_fields = {}
-            return
 
-        if isinstance(properties, dict):
-            properties = [properties]
+_EML_XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
+_ISO_DATE_TOKEN_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+_TEMPORAL_RANGE_SEPARATOR_RE = re.compile(r"/| to | - | – ")
 
-        field_map = {}
-        for prop in properties:
-            name = prop.get("@name")
-            qual_name = prop.get("@qualName")
-            if not name or not qual_name:
-                # Skip malformed entries but keep processing others.
-                continue
-            field_map[name] = qual_name
 
-        self.dwc_fields = field_map
+@lru_cache(maxsize=1)
+def _eml_template_bytes() -> bytes:
+    """Raw EML template, read from disk once; each `make_eml` call parses a fresh tree from memory."""
+    eml_path = _TEMPLATES_ROOT / "eml.xml"
+    if not eml_path.exists():
+        raise FileNotFoundError(f"EML template not found at: {eml_path}")
+    return eml_path.read_bytes()
+
 
 def make_eml(title, description, user=None, eml_extra: dict | None = None):
     """Render an EML document populated with available metadata and prune empty elements.
@@ -90,11 +165,7 @@ def make_eml(title, description, user=None, eml_extra: dict | None = None):
         eml_extra: Optional dict from `dataset.eml` with keys like
                    geographic_scope, temporal_scope, taxonomic_scope, methodology, users, project_title
     """
-    eml_path = _TEMPLATES_ROOT / "eml.xml"
-    if not eml_path.exists():
-        raise FileNotFoundError(f"EML template not found at: {eml_path}")
-    tree = ET.parse(str(eml_path))
-    root = tree.getroot()
+    root = ET.fromstring(_eml_template_bytes())
 
     # EML 2.2.0: the root is namespaced (eml:eml) but children are unqualified.
     # Work with unqualified child elements throughout.
@@ -106,6 +177,8 @@ def make_eml(title, description, user=None, eml_extra: dict | None = None):
         return elem.findall(path)
 
     def get_or_create(parent: ET.Element, tag: str) -> ET.Element:
+        # A bare tag takes ElementTree's C fast path (no ElementPath parsing), so a direct child scan is cheaper
+        # than keeping a tag index in sync with the removals and re-orderings done below
         child = parent.find(tag)
         if child is None:
             child = ET.SubElement(parent, tag)
@@ -198,19 +271,19 @@ def make_eml(title, description, user=None, eml_extra: dict | None = None):
         if not temporal_value_str:
             return None
 
-        iso_dates = re.findall(r"\b\d{4}-\d{2}-\d{2}\b", temporal_value_str)
+        iso_dates = _ISO_DATE_TOKEN_RE.findall(temporal_value_str)
         if len(iso_dates) >= 2:
             return ("range", iso_dates[0], iso_dates[-1])
         if len(iso_dates) == 1:
             return ("single", iso_dates[0])
 
+        # One regex scan finds the first range separator; a bare "-" is not a separator so "2020-05" stays intact
         range_parts = None
-        for sep in ("/", " to ", " - ", " – "):
-            if sep in temporal_value_str:
-                parts = [s.strip() for s in temporal_value_str.split(sep, 1)]
-                if len(parts) == 2 and parts[0] and parts[1]:
-                    range_parts = parts
-                    break
+        separator = _TEMPORAL_RANGE_SEPARATOR_RE.search(temporal_value_str)
+        if separator:
+            parts = [temporal_value_str[:separator.start()].strip(), temporal_value_str[separator.end():].strip()]
+            if parts[0] and parts[1]:
+                range_parts = parts
 
         if range_parts is not None:
             left, right = range_parts
@@ -422,19 +495,36 @@ def make_eml(title, description, user=None, eml_extra: dict | None = None):
         role_value: str | None = None,
         include_email: bool = True,
     ):
-        individual = get_or_create(parent_node, 'individualName')
-        set_text(get_or_create(individual, 'givenName'), person.get('first_name') or person.get('givenName') or '')
-        set_text(get_or_create(individual, 'surName'), person.get('last_name') or person.get('surName') or '')
+        given_name = person.get('first_name') or person.get('givenName') or ''
+        surname = person.get('last_name') or person.get('surName') or ''
 
         orcid_value = (person.get('orcid') or person.get('userId') or '')
         if orcid_value is None:
             orcid_value = ''
         orcid_value = str(orcid_value).strip()
 
-        if include_email:
-            email_value = person.get('email') or person.get('electronicMailAddress') or ''
+        email_value = (person.get('email') or person.get('electronicMailAddress') or '') if include_email else ''
+
+        if len(parent_node) == 0:
+            # Freshly created node (extra creators, contact, personnel): append children directly in
+            # schema order, with no find() scans and no re-sort
+            individual = ET.SubElement(parent_node, 'individualName')
+            set_text(ET.SubElement(individual, 'givenName'), given_name)
+            set_text(ET.SubElement(individual, 'surName'), surname)
             if email_value:
-                set_text(get_or_create(parent_node, 'electronicMailAddress'), email_value)
+                set_text(ET.SubElement(parent_node, 'electronicMailAddress'), email_value)
+            if orcid_value:
+                ET.SubElement(parent_node, 'userId', directory='https://orcid.org/').text = orcid_value
+            if include_role:
+                set_text(ET.SubElement(parent_node, 'role'), role_value or 'metadataProvider')
+            return
+
+        individual = get_or_create(parent_node, 'individualName')
+        set_text(get_or_create(individual, 'givenName'), given_name)
+        set_text(get_or_create(individual, 'surName'), surname)
+
+        if email_value:
+            set_text(get_or_create(parent_node, 'electronicMailAddress'), email_value)
         if orcid_value:
             user_id = get_or_create(parent_node, 'userId')
             user_id.set('directory', 'https://orcid.org/')
@@ -487,10 +577,8 @@ def make_eml(title, description, user=None, eml_extra: dict | None = None):
     if users_list:
         for existing_creator in list(findall(dataset_node, 'creator')):
             dataset_node.remove(existing_creator)
-        metadata_provider = find(dataset_node, 'metadataProvider')
-        insert_index = 0
-        if metadata_provider is not None:
-            insert_index = list(dataset_node).index(metadata_provider)
+        # Reuse the metadataProvider element fetched above instead of searching dataset_node for it again
+        insert_index = list(dataset_node).index(metadata_provider_node)
 
         for person in users_list:
             creator = ET.Element('creator')
@@ -646,22 +734,85 @@ def make_eml(title, description, user=None, eml_extra: dict | None = None):
         has_attributes = len(element.attrib) > 0
         return not has_text and not has_children and not has_attributes
 
-    def prune(element: ET.Element):
-        # Copy list to avoid modification during iteration
-        for child in list(element):
-            prune(child)
+    def prune(root_element: ET.Element):
+        # Iterative post-order walk: children are pruned before their parent decides which of them to keep,
+        # and survivors are written back with one slice assignment instead of repeated O(n) remove() calls
+        stack = [(root_element, False)]
+        while stack:
+            element, children_done = stack.pop()
+            if not children_done:
+                # Leaves have nothing to prune below them, so they never get a second visit
+                if len(element):
+                    stack.append((element, True))
+                    stack.extend((child, False) for child in element)
+                continue
             # Preserve intellectualRights if present, even if empty (it has license text in template anyway)
-            # Preserve intellectualRights if present
-            if is_empty(child) and child.tag not in {'intellectualRights'}:
-                element.remove(child)
+            survivors = [child for child in element if not is_empty(child) or child.tag == 'intellectualRights']
+            if len(survivors) != len(element):
+                element[:] = survivors
 
     prune(root)
 
-    return ET.tostring(root, encoding='utf-8', xml_declaration=True).decode('utf-8')
+    # Serialize straight to str; the declaration is prepended by hand so there is no bytes encode/decode round trip
+    return _EML_XML_DECLARATION + ET.tostring(root, encoding='unicode')
+
+
+# Larger multipart chunks mean fewer round trips to MinIO for big archives (minimum allowed is 5 MiB)
+_UPLOAD_PART_SIZE = 16 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def get_minio_client() -> Minio:
+    """MinIO client for DwCA uploads, created once so its urllib3 connection pool is reused across uploads."""
+    settings = get_publish_settings()
+    return Minio(settings.minio_uri, access_key=settings.minio_access_key, secret_key=settings.minio_secret_key)
+
 
-@retry(stop=stop_after_attempt(10), wait=wait_fixed(2))
+# S3 error codes worth another attempt; anything else (NoSuchBucket, AccessDenied, ...) will not fix itself
+_TRANSIENT_S3_ERROR_CODES = frozenset({'InternalError', 'RequestTimeout', 'ServiceUnavailable', 'SlowDown'})
+
+
+def _is_transient_upload_error(exc: BaseException) -> bool:
+    if isinstance(exc, S3Error):
+        return exc.code in _TRANSIENT_S3_ERROR_CODES
+    return isinstance(exc, (ServerError, urllib3.exceptions.HTTPError, ConnectionError))
+
+
+# Jittered exponential backoff so concurrent publishers do not retry against MinIO in lockstep
+@retry(
+    stop=stop_after_delay(30),
+    wait=wait_exponential_jitter(initial=0.5, max=8),
+    retry=retry_if_exception(_is_transient_upload_error),
+)
 def upload_file(client, bucket_name, object_name, local_path):
-    client.fput_object(bucket_name, object_name, local_path, content_type="application/zip")
+    client.fput_object(
+        bucket_name,
+        object_name,
+        local_path,
+        content_type="application/zip",
+        part_size=_UPLOAD_PART_SIZE,
+    )
+
+# Positions of the 32 hex digits within the 36-character canonical UUID string (dashes at 8, 13, 18, 23)
+_UUID_HEX_POSITIONS = np.array([i for i in range(36) if i not in (8, 13, 18, 23)])
+
+
+def random_uuid4_strings(count: int) -> list[str]:
+    """
+    Return ``count`` random RFC 4122 version 4 UUID strings, equivalent to ``str(uuid.uuid4())`` per row
+    but drawing all randomness in one ``os.urandom`` call and formatting with NumPy.
+    """
+    if count <= 0:
+        return []
+    raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    hex_digits = np.frombuffer(raw.tobytes().hex().encode('ascii'), dtype=np.uint8).reshape(count, 32)
+    formatted = np.full((count, 36), ord('-'), dtype=np.uint8)
+    formatted[:, _UUID_HEX_POSITIONS] = hex_digits
+    text = formatted.tobytes().decode('ascii')
+    return [text[i:i + 36] for i in range(0, 36 * count, 36)]
+
 
 def ensure_identifier_column(df, target_name: str) -> int:
     """
@@ -669,17 +820,16 @@ def ensure_identifier_column(df, target_name: str) -> int:
     return its positional index. If the column is absent, reuse a generic ``id`` column
     when available or mint fresh UUID4 values.
     """
-    target_lower = target_name.lower()
-    columns_lower = [str(col).lower() for col in df.columns]
+    # One pass over the header; iterating in reverse lets the first matching column win, as list.index() did
+    positions_by_lower = {str(col).lower(): i for i, col in reversed(list(enumerate(df.columns)))}
 
-    if target_lower in columns_lower:
-        return columns_lower.index(target_lower)
+    position = positions_by_lower.get(target_name.lower(), positions_by_lower.get("id"))
+    if position is not None:
+        return position
 
-    if "id" in columns_lower:
-        return columns_lower.index("id")
-
-    df[target_name] = [str(uuid.uuid4()) for _ in range(len(df))]
-    return df.columns.get_loc(target_name)
+    df[target_name] = random_uuid4_strings(len(df))
+    # A new column is always appended last, so there is no need to search the header for it
+    return len(df.columns) - 1
 
 
 def assert_case_insensitive_unique_identifier(df, column_name: str):
@@ -708,6 +858,22 @@ def assert_case_insensitive_unique_identifier(df, column_name: str):
         )
 
 
+# Tree-file patterns, compiled once instead of going through re's shared (evictable) pattern cache on every parse.
+# A Newick tip label must contain at least one letter so pure-number branch lengths are not matched.
+_NEWICK_LABEL_RE = re.compile(
+    r'([A-Za-z][A-Za-z0-9_\-\.]*|[A-Za-z0-9_\-\.]*[A-Za-z][A-Za-z0-9_\-\.]*|[A-Za-z])(?=:|\s*[,;)]|$)'
+)
+_NEXUS_TRANSLATE_RE = re.compile(r'TRANSLATE\s+(.*?);', re.DOTALL | re.IGNORECASE)
+_NEXUS_TRANSLATE_ENTRY_RE = re.compile(r'(\S+)\s+([A-Za-z0-9_\-\.]+)[,\s]*')
+_NEXUS_NUMERIC_TRANSLATE_ENTRY_RE = re.compile(r'(\d+)\s+([A-Za-z0-9_\-\.]+)[,\s]*')
+_NEXUS_TREE_RE = re.compile(r'TREE\s+[^=]+=\s*(.*?);', re.DOTALL | re.IGNORECASE)
+_NEXUS_COMMENT_RE = re.compile(r'\[[^\]]*\]')
+_NEXUS_NUMERIC_TOKEN_RE = re.compile(r'(^|[\(\,:\s])(\d+)([\)\,:\s]|$)')
+_WHITESPACE_RE = re.compile(r'\s+')
+# A Newick label/branch-length run ends at the next structural character
+_NEWICK_LABEL_RUN_RE = re.compile(r'[^(),;]*')
+
+
 def parse_newick_tip_labels(content: str) -> list[str]:
     """
     Extract tip labels from a Newick format tree string.
@@ -725,8 +891,7 @@ def parse_newick_tip_labels(content: str) -> list[str]:
     # Match labels that appear before colons (branch lengths) or at the end
     # Important: Don't match pure numbers (branch lengths) - they must contain at least one letter
     # Pattern: match sequences that contain at least one letter, before : or end of token
-    pattern = r'([A-Za-z][A-Za-z0-9_\-\.]*|[A-Za-z0-9_\-\.]*[A-Za-z][A-Za-z0-9_\-\.]*|[A-Za-z])(?=:|\s*[,;)]|$)'
-    matches = re.findall(pattern, content)
+    matches = _NEWICK_LABEL_RE.findall(content)
     # Filter out empty strings, pure numbers, and very short matches
     # Also remove duplicates while preserving order
     seen = set()
@@ -757,19 +922,19 @@ def parse_nexus_tip_labels(content: str) -> list[str]:
     tip_labels = []
     
     # Check if there's a TRANSLATE block
-    translate_match = re.search(r'TRANSLATE\s+(.*?);', content, re.DOTALL | re.IGNORECASE)
+    translate_match = _NEXUS_TRANSLATE_RE.search(content)
     if translate_match:
         translate_block = translate_match.group(1)
         # Parse translate entries: key value, or key value,
         # Handle both comma-separated and space-separated entries
         # Format: key value, or key value;
-        translate_entries = re.findall(r'(\S+)\s+([A-Za-z0-9_\-\.]+)[,\s]*', translate_block)
+        translate_entries = _NEXUS_TRANSLATE_ENTRY_RE.findall(translate_block)
         # Use the translated names (second value) as tip labels
         tip_labels = [entry[1].strip() for entry in translate_entries if entry[1].strip()]
     else:
         # No TRANSLATE block, extract labels directly from tree
         # Look for TREE blocks
-        tree_match = re.search(r'TREE\s+[^=]+=\s*(.*?);', content, re.DOTALL | re.IGNORECASE)
+        tree_match = _NEXUS_TREE_RE.search(content)
         if tree_match:
             tree_string = tree_match.group(1)
             # Extract tip labels using newick parsing
@@ -778,6 +943,22 @@ def parse_nexus_tip_labels(content: str) -> list[str]:
     return tip_labels
 
 
+def _apply_newick_label(node: dict, label_str: str):
+    """Set a node's name and branch length from its raw "label:length" text."""
+    label_str = label_str.strip()
+    if ':' in label_str:
+        parts = label_str.split(':', 1)
+        label = parts[0].strip() if parts[0].strip() else None
+        try:
+            node["branch_length"] = float(parts[1].strip())
+        except (ValueError, IndexError):
+            node["branch_length"] = 0
+        if label:
+            node["name"] = label
+    elif label_str:
+        node["name"] = label_str
+
+
 def parse_newick_to_tree(newick_string: str) -> dict:
     """
     Parse a Newick format tree string into a hierarchical JSON structure.
@@ -793,67 +974,6 @@ def parse_newick_to_tree(newick_string: str) -> dict:
             "children": [...]
         }
     """
-    def parse_node(token_stream, pos):
-        """Recursively parse a node from the token stream."""
-        node = {"name": None, "branch_length": 0, "children": []}
-        
-        # Check for opening parenthesis (internal node)
-        if pos < len(token_stream) and token_stream[pos] == '(':
-            pos += 1  # Skip '('
-            
-            # Parse children until we hit ')'
-            while pos < len(token_stream) and token_stream[pos] != ')':
-                child, pos = parse_node(token_stream, pos)
-                node["children"].append(child)
-                
-                # Skip comma separator
-                if pos < len(token_stream) and token_stream[pos] == ',':
-                    pos += 1
-            
-            # Skip closing ')'
-            if pos < len(token_stream) and token_stream[pos] == ')':
-                pos += 1
-            
-            # Parse label and/or branch length
-            label_parts = []
-            while pos < len(token_stream) and token_stream[pos] not in '(),;':
-                label_parts.append(token_stream[pos])
-                pos += 1
-            
-            label_str = ''.join(label_parts).strip()
-            if ':' in label_str:
-                parts = label_str.split(':', 1)
-                label = parts[0].strip() if parts[0].strip() else None
-                try:
-                    node["branch_length"] = float(parts[1].strip())
-                except (ValueError, IndexError):
-                    node["branch_length"] = 0
-                if label:
-                    node["name"] = label
-            elif label_str:
-                node["name"] = label_str
-        else:
-            # Leaf node - parse label and branch length
-            label_parts = []
-            while pos < len(token_stream) and token_stream[pos] not in '(),;':
-                label_parts.append(token_stream[pos])
-                pos += 1
-            
-            label_str = ''.join(label_parts).strip()
-            if ':' in label_str:
-                parts = label_str.split(':', 1)
-                label = parts[0].strip() if parts[0].strip() else None
-                try:
-                    node["branch_length"] = float(parts[1].strip())
-                except (ValueError, IndexError):
-                    node["branch_length"] = 0
-                if label:
-                    node["name"] = label
-            elif label_str:
-                node["name"] = label_str
-        
-        return node, pos
-    
     # Remove whitespace except what's inside quoted labels
     cleaned = newick_string.strip()
     if cleaned.endswith(';'):
@@ -861,14 +981,49 @@ def parse_newick_to_tree(newick_string: str) -> dict:
     
     # Remove whitespace for easier parsing (but preserve structure)
     # This is a simple approach - for more complex cases, a proper tokenizer would be better
-    cleaned = re.sub(r'\s+', '', cleaned)
-    
-    # Simple tokenization: split into individual characters for parsing
-    # This handles the tree structure character by character
-    tokens = list(cleaned)
-    
-    root, _ = parse_node(tokens, 0)
-    return root
+    cleaned = _WHITESPACE_RE.sub('', cleaned)
+    # Only the first tree is parsed; cutting at a stray ';' also keeps the sibling loop below from stalling on it
+    cleaned = cleaned.split(';', 1)[0]
+    length = len(cleaned)
+
+    # Single pass with a cursor into the string and an explicit stack of open internal nodes, so there is no
+    # per-character token list and deep trees cannot hit the recursion limit
+    open_nodes = []
+    pos = 0
+    while True:
+        if pos < length and cleaned[pos] == '(':
+            open_nodes.append({"name": None, "branch_length": 0, "children": []})
+            pos += 1
+            if pos < length and cleaned[pos] != ')':
+                continue  # Parse the first child
+            completed = None  # "()" - close the node straight away
+        else:
+            # Leaf node - parse label and branch length
+            completed = {"name": None, "branch_length": 0, "children": []}
+            label_end = _NEWICK_LABEL_RUN_RE.match(cleaned, pos).end()
+            _apply_newick_label(completed, cleaned[pos:label_end])
+            pos = label_end
+
+        while True:
+            if completed is None:
+                # Skip closing ')' and parse the internal node's own label and/or branch length
+                completed = open_nodes.pop()
+                if pos < length and cleaned[pos] == ')':
+                    pos += 1
+                label_end = _NEWICK_LABEL_RUN_RE.match(cleaned, pos).end()
+                _apply_newick_label(completed, cleaned[pos:label_end])
+                pos = label_end
+
+            if not open_nodes:
+                return completed
+
+            open_nodes[-1]["children"].append(completed)
+            completed = None
+            # Skip comma separator
+            if pos < length and cleaned[pos] == ',':
+                pos += 1
+            if pos < length and cleaned[pos] != ')':
+                break  # Another child follows
 
 
 def parse_nexus_to_tree(nexus_content: str) -> dict:
@@ -885,22 +1040,22 @@ def parse_nexus_to_tree(nexus_content: str) -> dict:
     """
     # First, check for a TRANSLATE block and build a mapping
     translate_map = {}
-    translate_match = re.search(r'TRANSLATE\s+(.*?);', nexus_content, re.DOTALL | re.IGNORECASE)
+    translate_match = _NEXUS_TRANSLATE_RE.search(nexus_content)
     if translate_match:
         translate_block = translate_match.group(1)
         # Parse translate entries: key value, or key value,
         # Format: "1 Ephedrales_Ephedraceae_Ephedra_sinica_VDAO," or "1 Ephedrales_Ephedraceae_Ephedra_sinica_VDAO;"
-        translate_entries = re.findall(r'(\d+)\s+([A-Za-z0-9_\-\.]+)[,\s]*', translate_block)
+        translate_entries = _NEXUS_NUMERIC_TRANSLATE_ENTRY_RE.findall(translate_block)
         for key, value in translate_entries:
             translate_map[key] = value.strip()
     
     # Extract tree string from NEXUS file
-    tree_match = re.search(r'TREE\s+[^=]+=\s*(.*?);', nexus_content, re.DOTALL | re.IGNORECASE)
+    tree_match = _NEXUS_TREE_RE.search(nexus_content)
     if tree_match:
         tree_string = tree_match.group(1).strip()
         # Remove any comments or metadata
         # NEXUS files might have comments like [&R] before the tree
-        tree_string = re.sub(r'\[[^\]]*\]', '', tree_string)
+        tree_string = _NEXUS_COMMENT_RE.sub('', tree_string)
         
         # If we have a translate map, replace numeric IDs with their translated names
         # OPTIMIZED: Use a single regex pass with a callback function
@@ -924,8 +1079,7 @@ def parse_nexus_to_tree(nexus_content: str) -> dict:
                 
                 # Use a pattern that matches any sequence of digits
                 # The replacer will check if it's in our translate map
-                pattern = r'(^|[\(\,:\s])(\d+)([\)\,:\s]|$)'
-                tree_string = re.sub(pattern, replacer, tree_string)
+                tree_string = _NEXUS_NUMERIC_TOKEN_RE.sub(replacer, tree_string)
             else:
                 # For smaller maps, build an optimized alternation pattern
                 escaped_keys = [re.escape(key) for key in sorted_keys]
@@ -1081,19 +1235,21 @@ def upload_dwca(
 
     file_name = datetime.now().strftime('output-%Y-%m-%d-%H%M%S') + '.zip'
     try:
-        with tempfile.TemporaryDirectory() as temp_dir:
+        settings = get_publish_settings()
+        # Archives are built in a scratch directory before upload (see PublishSettings.dwca_export_dir)
+        with tempfile.TemporaryDirectory(dir=settings.dwca_export_dir) as temp_dir:
             local_path = os.path.join(temp_dir, file_name)
             archive.export(local_path)
             
             # Add additional files (e.g., tree files) to the archive
+            # Level 1 deflates a 1 MB tree file ~3x faster than the default 6 for ~15% more bytes
             if additional_files:
-                with zipfile.ZipFile(local_path, 'a', zipfile.ZIP_DEFLATED) as zipf:
+                with zipfile.ZipFile(local_path, 'a', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
                     for filename, file_content in additional_files:
                         zipf.writestr(filename, file_content)
             
-            client = Minio(os.getenv('MINIO_URI'), access_key=os.getenv('MINIO_ACCESS_KEY'), secret_key=os.getenv('MINIO_SECRET_KEY'))
-            upload_file(client, os.getenv('MINIO_BUCKET'), f"{os.getenv('MINIO_BUCKET_FOLDER')}/{file_name}", local_path)
-            return f"https://{os.getenv('MINIO_URI')}/{os.getenv('MINIO_BUCKET')}/{os.getenv('MINIO_BUCKET_FOLDER')}/{file_name}"
+            upload_file(get_minio_client(), settings.minio_bucket, f"{settings.minio_bucket_folder}/{file_name}", local_path)
+            return f"https://{settings.minio_uri}/{settings.minio_bucket}/{settings.minio_bucket_folder}/{file_name}"
     except Exception as e:
         error_msg = (
             f"🚨 UploadDwCA Error - Failed during archive export/upload:\n"
@@ -1104,17 +1260,29 @@ def upload_dwca(
         discord_bot.send_discord_message(error_msg)
         raise
 
+
+def _post_registry_json(url, payload):
+    # Encode the body ourselves with ujson instead of letting requests run stdlib json.dumps on `json=`
+    return get_gbif_session().post(
+        url,
+        data=ujson.dumps(payload, escape_forward_slashes=False).encode('utf-8'),
+        headers={'Content-Type': 'application/json'},
+        timeout=_GBIF_REGISTRY_TIMEOUT,
+    )
+
+
 def register_dataset_and_endpoint(title, description, url):
     print('registering dataset')
+    settings = get_publish_settings()
     payload = {
         'title': title,
         'description': description,
-        'publishingOrganizationKey': os.getenv('GBIF_PUBLISHING_ORGANIZATION_KEY'),
-        'installationKey': os.getenv('GBIF_INSTALLATION_KEY'),
+        'publishingOrganizationKey': settings.gbif_publishing_organization_key,
+        'installationKey': settings.gbif_installation_key,
         'language': 'en',
         'type': 'OCCURRENCE'
     }
-    response = requests.post(f"{os.getenv('GBIF_API_URL')}/dataset", json=payload, headers={'Content-Type': 'application/json'}, auth=HTTPBasicAuth(os.getenv('GBIF_USER'), os.getenv('GBIF_PASSWORD')))
+    response = _post_registry_json(f"{settings.gbif_api_url}/dataset", payload)
     if response.status_code == 201:
         dataset_key = response.json()
     else:
@@ -1127,6 +1295,7 @@ def register_dataset_and_endpoint(title, description, url):
 
 def register_endpoint(dataset_key, url):
     payload = { 'type': 'DWC_ARCHIVE', 'url': url, 'machineTags': [] }
-    response = requests.post(f"{os.getenv('GBIF_API_URL')}/dataset/{dataset_key}/endpoint", json=payload, headers={'Content-Type': 'application/json'}, auth=HTTPBasicAuth(os.getenv('GBIF_USER'), os.getenv('GBIF_PASSWORD')))
+    # Same pooled session as the dataset POST, so this reuses its already-open TLS connection
+    response = _post_registry_json(f"{get_publish_settings().gbif_api_url}/dataset/{dataset_key}/endpoint", payload)
     if response.status_code != 201:
         raise requests.exceptions.HTTPError(f'Failed to add endpoint. Status code: {response.status_code}, Response JSON: {response.json()}')
@@ -1,12 +1,12 @@
 from django.db import migrations, models
+from django.db.models import F
 
 
 def set_initial_task_order(apps, schema_editor):
     """Set initial order based on current ID (load_tasks will update this properly)"""
     Task = apps.get_model('api', 'Task')
-    for task in Task.objects.all():
-        task.order = task.id
-        task.save(update_fields=['order'])
+    # One UPDATE ... SET "order" = "id" instead of a save() per row
+    Task.objects.update(order=F('id'))
 
 
 class Migration(migrations.Migration):
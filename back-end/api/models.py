@@ -876,8 +876,10 @@ class Agent(models.Model):
             return last_message
 
         # Otherwise we need to send it to GPT, last message was from the user, was the return from a function, or was the starting system message
+        # Claim the turn atomically so a concurrent refresh and a background kick-off can't both start one
+        if not Agent.objects.filter(pk=self.pk, busy_thinking=False).update(busy_thinking=True):
+            return last_message
         self.busy_thinking = True
-        self.save()
         try:
             recent_non_system_messages = list(
                 self.message_set.exclude(openai_obj__role=Message.Role.SYSTEM).order_by('-created_at')[:2]
@@ -888,7 +890,8 @@ class Agent(models.Model):
 
             # Main GPT interaction
             response_message = create_response_message(
-                self.message_set.all(),
+                # Only the stored OpenAI payload is read when building the request input
+                self.message_set.only('openai_obj'),
                 self.task.functions,
                 pdf_user_files=self.dataset.user_files.filter(file__iendswith='.pdf').order_by('uploaded_at', 'id'),
             )
@@ -1,20 +1,33 @@
 import os
 import datetime
 import io
+import uuid
 import zipfile
 import xml.etree.ElementTree as ET
 from types import SimpleNamespace
-from unittest.mock import patch
-from django.test import SimpleTestCase
+from unittest.mock import MagicMock, patch
+from django.test import SimpleTestCase, override_settings
 import openpyxl
 import pandas as pd
 from .helpers.publish import (
     assert_case_insensitive_unique_identifier,
+    ensure_identifier_column,
     make_eml,
     parse_newick_tip_labels,
+    parse_newick_to_tree,
     parse_nexus_tip_labels,
 )
-from .agent_tools import GetDarwinCoreInfo, SetEML, LogBugWithDeveloper, SetBasicMetadata
+from . import agent_tools
+from .agent_tools import (
+    BasicValidationForSomeDwCTerms,
+    GetDarwinCoreInfo,
+    LogBugWithDeveloper,
+    PublishToGBIF,
+    SetBasicMetadata,
+    SetEML,
+    ValidateDwCA,
+)
+from .helpers import discord_bot
 from .helpers.openai_helpers import (
     _attach_pdf_files_to_latest_user_message,
     _functions_to_responses_tools,
@@ -431,6 +444,26 @@ class EmlGenerationTests(SimpleTestCase):
         self.assertEqual(begin.text, '2025-10-17')
         self.assertEqual(end.text, '2025-10-22')
 
+    def test_make_eml_splits_mixed_separator_temporal_scope_at_first_separator(self):
+        # The range splits at the first separator in the text, so a slash inside a date is left alone
+        xml_text = make_eml(
+            title='Temporal mixed separators',
+            description='Abstract text',
+            eml_extra={'temporal_scope': '2019 - 2020/05/01'},
+        )
+        dataset = ET.fromstring(xml_text.encode('utf-8')).find('dataset')
+        self.assertEqual(dataset.find('coverage/temporalCoverage/rangeOfDates/beginDate/calendarDate').text, '2019-01-01')
+        self.assertEqual(dataset.find('coverage/temporalCoverage/rangeOfDates/endDate/calendarDate').text, '2020-05-01')
+
+        # Trailing text after a second separator leaves the end unparseable, so no temporal coverage is written
+        xml_text = make_eml(
+            title='Temporal mixed separators',
+            description='Abstract text',
+            eml_extra={'temporal_scope': '1990-01 to 1995-02 - notes'},
+        )
+        dataset = ET.fromstring(xml_text.encode('utf-8')).find('dataset')
+        self.assertIsNone(dataset.find('coverage/temporalCoverage'))
+
     def test_make_eml_extracts_iso_dates_from_free_text_temporal_scope(self):
         class DummyUser:
             first_name = 'Alice'
@@ -475,6 +508,17 @@ class IdentifierValidationTests(SimpleTestCase):
         df = pd.DataFrame({'occurrenceID': ['', None, 'x-1']})
         assert_case_insensitive_unique_identifier(df, 'occurrenceID')
 
+    def test_missing_identifier_column_is_filled_with_unique_uuid4_values(self):
+        df = pd.DataFrame({'scientificName': ['Puma concolor'] * 50})
+        index = ensure_identifier_column(df, 'occurrenceID')
+        self.assertEqual(df.columns[index], 'occurrenceID')
+        values = df['occurrenceID'].tolist()
+        self.assertEqual(len(set(values)), 50)
+        for value in values:
+            parsed = uuid.UUID(value)
+            self.assertEqual(str(parsed), value)
+            self.assertEqual(parsed.version, 4)
+
 
 class PhylogenyParsingTests(SimpleTestCase):
     """Tests for phylogenetic tree parsing and matching functions."""
@@ -616,6 +660,28 @@ END;"""
         # Note: current implementation may not handle quotes, but should not crash
         self.assertIsInstance(tip_labels, list)
 
+    def test_parse_newick_to_tree_structure_and_branch_lengths(self):
+        """Test that internal labels, branch lengths and nesting are kept."""
+        tree = parse_newick_to_tree("(A:0.1,B:0.2,(C:0.3,D:0.4)cd:0.5);")
+
+        self.assertIsNone(tree["name"])
+        self.assertEqual([child["name"] for child in tree["children"]], ["A", "B", "cd"])
+        self.assertEqual(tree["children"][1]["branch_length"], 0.2)
+        inner = tree["children"][2]
+        self.assertEqual(inner["branch_length"], 0.5)
+        self.assertEqual([(c["name"], c["branch_length"]) for c in inner["children"]], [("C", 0.3), ("D", 0.4)])
+
+    def test_parse_newick_to_tree_handles_very_deep_nesting(self):
+        """Test that deep (e.g. caterpillar) trees do not hit the recursion limit."""
+        depth = 5000
+        tree = parse_newick_to_tree("(" * depth + "A" + ")" * depth + ";")
+
+        node = tree
+        for _ in range(depth):
+            self.assertEqual(len(node["children"]), 1)
+            node = node["children"][0]
+        self.assertEqual(node["name"], "A")
+
 
 class GetDarwinCoreInfoTests(SimpleTestCase):
     def test_summary_response_lists_sections_only(self):
@@ -944,6 +1010,27 @@ class ExcelWorkbookRepairTests(SimpleTestCase):
         self.assertEqual(workbook_bytes, sanitized_bytes)
 
 
+# Keep GBIF match lookups in tests off the on-disk cache configured in settings
+GBIF_TEST_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "gbif": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "gbif-tests"},
+}
+
+
+@override_settings(CACHES=GBIF_TEST_CACHES)
+class GbifNameMatchCacheTests(SimpleTestCase):
+    @patch.object(BasicValidationForSomeDwCTerms, "_fetch_gbif_name_matches")
+    def test_repeat_lookups_are_served_from_the_gbif_cache(self, fetch_mock):
+        fetch_mock.side_effect = lambda names: {name: {"matchType": "EXACT"} for name in names}
+
+        first = BasicValidationForSomeDwCTerms._resolve_gbif_name_matches(["Puma concolor"])
+        second = BasicValidationForSomeDwCTerms._resolve_gbif_name_matches(["Puma concolor", "Lynx lynx"])
+
+        self.assertEqual(first, {"Puma concolor": {"matchType": "EXACT"}})
+        self.assertEqual(set(second), {"Puma concolor", "Lynx lynx"})
+        self.assertEqual([call.args[0] for call in fetch_mock.call_args_list], [["Puma concolor"], ["Lynx lynx"]])
+
+
 class LogBugWithDeveloperTests(SimpleTestCase):
     @patch("api.agent_tools.discord_bot.send_discord_message")
     def test_uses_discord_user_id_for_direct_mention(self, send_discord_message_mock):
@@ -975,6 +1062,110 @@ class LogBugWithDeveloperTests(SimpleTestCase):
         self.assertIn("Validation response parsing failed", sent_message)
         self.assertNotIn("allowed_mentions", send_discord_message_mock.call_args.kwargs)
 
+    @patch("api.agent_tools.discord_bot.send_discord_message")
+    def test_reports_webhook_failure_to_the_model(self, send_discord_message_mock):
+        send_discord_message_mock.side_effect = RuntimeError("Discord webhook returned status code 500")
+
+        result = LogBugWithDeveloper(message="Validation response parsing failed").run()
+
+        self.assertTrue(send_discord_message_mock.call_args.kwargs["wait"])
+        self.assertIn("Failed to log bug with developer", result)
+        self.assertIn("status code 500", result)
+
+
+class DiscordBotTests(SimpleTestCase):
+    def test_waiting_send_raises_when_webhook_is_unset(self):
+        with patch.dict(os.environ, {"DISCORD_WEBHOOK": ""}, clear=False):
+            with self.assertRaises(RuntimeError):
+                discord_bot.send_discord_message("hello", wait=True)
+
+    @patch("api.helpers.discord_bot._session.post")
+    def test_waiting_send_raises_on_rejected_post(self, post_mock):
+        post_mock.return_value = SimpleNamespace(status_code=400)
+        with patch.dict(os.environ, {"DISCORD_WEBHOOK": "https://discord.invalid/webhook"}, clear=False):
+            with self.assertRaises(RuntimeError):
+                discord_bot.send_discord_message("hello", wait=True)
+
+
+class ValidateDwCATests(SimpleTestCase):
+    @patch("tenacity.nap.time.sleep")
+    @patch("api.agent_tools.discord_bot.send_discord_message")
+    @patch("api.agent_tools.get_gbif_session")
+    @patch("api.models.Agent.objects.get")
+    def test_polling_reads_top_level_status_not_nested_ones(self, agent_get_mock, session_mock, _discord_mock, _sleep_mock):
+        agent_get_mock.return_value = SimpleNamespace(dataset=SimpleNamespace(dwca_url="https://example.org/dwca.zip"))
+        session = session_mock.return_value
+        session.post.return_value = MagicMock(status_code=201, content=b'{"key": "abc"}')
+        # A nested per-file status appears before the top-level one while the job is still running
+        running = b'{"file": {"status": "SUCCEEDED"}, "status": "RUNNING"}'
+        finished = b'{"file": {"status": "SUCCEEDED"}, "status": "FINISHED"}'
+        session.get.side_effect = [
+            MagicMock(status_code=200, content=running, text=running.decode()),
+            MagicMock(status_code=200, content=finished, text=finished.decode()),
+        ]
+
+        result = ValidateDwCA(agent_id=1).run()
+
+        self.assertEqual(result, finished.decode())
+        self.assertEqual(session.get.call_count, 2)
+
+
+class AgentTurnClaimTests(SimpleTestCase):
+    def _agent_with_pending_turn(self):
+        from .models import Agent, Message
+
+        agent = Agent(pk=1)
+        last_message = SimpleNamespace(role=Message.Role.SYSTEM)
+        message_set = MagicMock()
+        message_set.last.return_value = last_message
+        return agent, last_message, message_set
+
+    @patch("api.models.create_response_message")
+    def test_refresh_does_not_start_a_second_turn_once_kickoff_has_claimed_it(self, create_response_mock):
+        from .models import Agent
+
+        agent, last_message, message_set = self._agent_with_pending_turn()
+        # The in-memory agent still reads busy_thinking=False, but a background kick-off has already claimed the row
+        with patch.object(Agent, "message_set", new=message_set), \
+                patch.object(Agent.objects, "filter") as filter_mock, \
+                patch.object(Agent, "save") as save_mock:
+            filter_mock.return_value.update.return_value = 0
+            result = agent.next_message()
+
+        filter_mock.assert_called_once_with(pk=1, busy_thinking=False)
+        filter_mock.return_value.update.assert_called_once_with(busy_thinking=True)
+        self.assertIs(result, last_message)
+        create_response_mock.assert_not_called()
+        save_mock.assert_not_called()
+
+
+class AgentKickOffTests(SimpleTestCase):
+    @patch("api.agent_tools.register_dataset_and_endpoint", return_value="https://www.gbif.org/dataset/abc")
+    @patch("api.models.Task.objects.values_list")
+    @patch("api.models.Agent.objects.get")
+    def test_publish_submits_the_next_agent_for_kick_off(self, agent_get_mock, values_list_mock, _register_mock):
+        dataset = MagicMock(dwca_url="https://example.org/dwca.zip")
+        dataset.next_agent.return_value = SimpleNamespace(id=8)
+        agent_get_mock.return_value = MagicMock(task_id=1, dataset=dataset)
+        values_list_mock.return_value.last.return_value = 2
+
+        with patch.object(agent_tools._AGENT_KICKOFF_EXECUTOR, "submit") as submit_mock:
+            result = PublishToGBIF(agent_id=7).run()
+
+        self.assertIn("Successfully registered dataset with GBIF", result)
+        submit_mock.assert_called_once_with(agent_tools._kick_off_agent, 8)
+
+    @patch("django.db.connection.close")
+    @patch("api.models.Agent.objects.get")
+    def test_failed_kick_off_is_logged_not_raised(self, agent_get_mock, connection_close_mock):
+        agent_get_mock.return_value.next_message.side_effect = RuntimeError("OpenAI is down")
+
+        with self.assertLogs("api.agent_tools", level="ERROR") as logs:
+            agent_tools._kick_off_agent(8)
+
+        self.assertIn("Failed to start agent 8", logs.output[0])
+        connection_close_mock.assert_called_once()
+
 
 class ResponsesAdapterCompatibilityTests(SimpleTestCase):
     class _Message:
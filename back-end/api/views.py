@@ -12,6 +12,7 @@ from django.conf import settings
 import requests
 from urllib.parse import urlencode
 import logging
+from itertools import repeat
 from math import isfinite
 
 logger = logging.getLogger(__name__)
@@ -457,7 +458,7 @@ class DatasetViewSet(viewsets.ModelViewSet):
         
         Returns tree data with occurrence counts based on phylogeny linking done by the agent.
         """
-        import json
+        import ujson
         from pathlib import Path
         from api.helpers.publish import parse_newick_to_tree, parse_nexus_to_tree
         
@@ -495,13 +496,19 @@ class DatasetViewSet(viewsets.ModelViewSet):
             has_coordinates = lat_col is not None and lon_col is not None
             
             if dp_col:
-                for _, row in df.iterrows():
-                    dp_val = row.get(dp_col)
+                # Walk plain column lists instead of df.iterrows(), which builds a pandas Series for every row
+                dp_values = df[dp_col].tolist()
+                if has_coordinates:
+                    coordinate_pairs = zip(df[lat_col].tolist(), df[lon_col].tolist())
+                else:
+                    coordinate_pairs = repeat((None, None))
+
+                for dp_val, (lat, lon) in zip(dp_values, coordinate_pairs):
                     if not dp_val or (isinstance(dp_val, str) and not dp_val.strip()):
                         continue
                     
                     try:
-                        dp = json.loads(dp_val) if isinstance(dp_val, str) else dp_val
+                        dp = ujson.loads(dp_val) if isinstance(dp_val, str) else dp_val
                         phylogenies = dp.get('phylogenies', [])
                         if not phylogenies:
                             continue
@@ -512,8 +519,6 @@ class DatasetViewSet(viewsets.ModelViewSet):
                         has_valid_coords = False
                         if has_coordinates:
                             try:
-                                lat = row.get(lat_col)
-                                lon = row.get(lon_col)
                                 if lat is not None and lon is not None:
                                     lat_f = float(lat) if lat != '' else None
                                     lon_f = float(lon) if lon != '' else None
@@ -529,7 +534,7 @@ class DatasetViewSet(viewsets.ModelViewSet):
                                 tip_label_counts[tip_label] = tip_label_counts.get(tip_label, 0) + 1
                                 if has_valid_coords:
                                     tip_labels_with_coords.add(tip_label)
-                    except (json.JSONDecodeError, TypeError, AttributeError):
+                    except (ValueError, TypeError, AttributeError):
                         continue
         
         # Parse tree file
@@ -620,7 +625,7 @@ class DatasetViewSet(viewsets.ModelViewSet):
         Expects: { "tip_labels": ["tip1", "tip2", ...] }
         Returns occurrences where dynamicProperties.phylogenies[].phyloTreeTipLabel matches.
         """
-        import json
+        import ujson
         
         dataset = self.get_object()
         tip_labels = request.data.get('tip_labels', [])
@@ -660,7 +665,7 @@ class DatasetViewSet(viewsets.ModelViewSet):
                 continue
             
             try:
-                dp = json.loads(dp_val) if isinstance(dp_val, str) else dp_val
+                dp = ujson.loads(dp_val) if isinstance(dp_val, str) else dp_val
                 phylogenies = dp.get('phylogenies', [])
                 
                 # Check if any of this row's tip labels match the requested ones
@@ -704,7 +709,7 @@ class DatasetViewSet(viewsets.ModelViewSet):
                 
                 matching_rows.append(occ)
                 
-            except (json.JSONDecodeError, TypeError, AttributeError):
+            except (ValueError, TypeError, AttributeError):
                 continue
         
         return Response({'occurrences': matching_rows})
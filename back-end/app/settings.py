@@ -148,6 +148,24 @@ DATABASES = {
 }
 
 
+# Caches
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# "gbif" holds GBIF species match results so repeat validations of the same names skip the API.
+# FileBasedCache unpickles what it reads, so it defaults to an app-owned directory (ignored by git and docker),
+# never a shared temp dir. Tests swap it for a LocMemCache with override_settings.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "gbif": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("GBIF_CACHE_DIR", os.path.join(BASE_DIR, ".gbif_cache")),
+        "TIMEOUT": 7 * 24 * 60 * 60,
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 